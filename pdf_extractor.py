@@ -8,7 +8,6 @@ them into a JSON format suitable for AI-based question generation.
 
 Requirements:
 - PyMuPDF (fitz)
-- pdfplumber  
 - Pillow
 
 Usage:
@@ -21,6 +20,10 @@ import sys
 import json
 import re
 import argparse
+import functools
+import io
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
@@ -31,237 +34,361 @@ except ImportError:
     sys.exit(1)
 
 try:
-    import pdfplumber
+    from PIL import Image
 except ImportError:
-    print("Error: pdfplumber not found. Install with: pip install pdfplumber")
+    print("Error: Pillow not found. Install with: pip install Pillow")
     sys.exit(1)
 
 try:
-    from PIL import Image
+    import orjson  # much faster JSON encoding, optional
 except ImportError:
-    print("Error: Pillow not found. Install with: pip install Pillow")
-    sys.exit(1)
+    orjson = None
 
 
-class PDFContentExtractor:
+def _dumps(obj) -> bytes:
+    """Serialize one JSON fragment, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 
-    def __init__(self, pdf_path: str, output_dir: str = "extracted_content"):
-        """
-        Initialize the PDF extractor
-        """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+def _format_question(q: Dict) -> Dict:
+    """Convert an internal question dict to the output format"""
+    formatted_q = {
+        "question": q["question"],
+        "images": q["images"],
+        "option_images": q["option_images"]
+    }
 
-        self.pdf_path = pdf_path
-        self.doc = fitz.open(pdf_path)
-        self.output_dir = output_dir
-        self.images_dir = os.path.join(output_dir, "images")
+    if q.get("options"):
+        formatted_q["options"] = q["options"]
+    if q.get("answer"):
+        formatted_q["answer"] = q["answer"]
+    if q.get("question_number"):
+        formatted_q["question_number"] = q["question_number"]
+    if q.get("page"):
+        formatted_q["page"] = q["page"]
 
-        # Create output directories
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(self.images_dir, exist_ok=True)
+    return formatted_q
 
-        print(f"Initialized extractor for: {pdf_path}")
-        print(f"Total pages: {self.doc.page_count}")
-        print(f"Output directory: {self.output_dir}")
+# Precompiled patterns for the question parser (compiling inside the
+# per-line loop is wasteful on large PDFs)
+_RE_QUESTION = re.compile(r'^(\d+)\.\s*(.+)')
+_RE_QUESTION_PREFIX = re.compile(r'^\d+\.')
+_RE_OPTION_PREFIX = re.compile(r'^\[?[A-D]\]')
+_RE_OPTION = re.compile(r'^\[?([A-D])\]?\s*(.*)')
+_RE_ANSWER = re.compile(r'Ans\.?\s*\[?([A-D])\]?')
+
+# Default worker count for parallel page extraction
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Invisible/private-use glyphs to strip from extracted text in one
+# translate() pass: zero-width spaces, joiners, BOM, Symbol-font bullet
+_STRIP_TABLE = str.maketrans("", "", "\u200b\u200c\u200d\ufeff\uf0b7")
 
-    def extract_text_from_page(self, page_num: int) -> str:
-        """Extract text using PyMuPDF"""
-        page = self.doc[page_num]
-        text = page.get_text()
-        return text
 
-    def extract_text_with_pdfplumber(self, page_num: int) -> str:
-        """Extract text using pdfplumber (often more accurate)"""
+# Images already written to disk, keyed by (pdf path, xref). Shared
+# assets like logos reappear on every page; with parallel extraction the
+# cache is per worker process but still avoids redundant encodes there.
+_SEEN_XREFS: Dict[Tuple[str, int], str] = {}
+
+
+def _extract_images_from_page(doc: "fitz.Document", page_num: int, images_dir: str) -> List[str]:
+
+    page = doc[page_num]
+    image_list = page.get_images()
+    extracted_images = []
+
+    if image_list:
+        # Created lazily so text-only PDFs never get an empty images dir
+        os.makedirs(images_dir, exist_ok=True)
+
+    img_prefix = images_dir + os.sep
+    for img_index, img in enumerate(image_list):
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                if page_num < len(pdf.pages):
-                    page = pdf.pages[page_num]
-                    return page.extract_text() or ""
-        except Exception as e:
-            print(f"pdfplumber extraction failed for page {page_num + 1}: {e}")
-            return self.extract_text_from_page(page_num)
-        return ""
+            xref = img[0]
 
-    def extract_images_from_page(self, page_num: int) -> List[str]:
-       
-        page = self.doc[page_num]
-        image_list = page.get_images()
-        extracted_images = []
-
-        for img_index, img in enumerate(image_list):
-            try:
-                xref = img[0]
-                pix = fitz.Pixmap(self.doc, xref)
-
-                # Filter out very small images (likely decorative)
-                if pix.width < 20 or pix.height < 20:
-                    pix = None
-                    continue
-
-                img_filename = f"page{page_num + 1}_image{img_index + 1}.png"
-                img_path = os.path.join(self.images_dir, img_filename)
-
-                if pix.n - pix.alpha < 4:  # GRAY or RGB
-                    pix.save(img_path)
-                else:  # CMYK: convert to RGB first
-                    pix1 = fitz.Pixmap(fitz.csRGB, pix)
-                    pix1.save(img_path)
-                    pix1 = None
-
-                extracted_images.append(img_path)
+            seen_key = (doc.name, xref)
+            if seen_key in _SEEN_XREFS:
+                extracted_images.append(_SEEN_XREFS[seen_key])
+                continue
+
+            info = doc.extract_image(xref)
+
+            # Filter out very small images (likely decorative)
+            if info["width"] < 20 or info["height"] < 20:
+                continue
+
+            if info["colorspace"] < 4:  # GRAY or RGB: keep original bytes
+                img_path = f"{img_prefix}page{page_num + 1}_image{img_index + 1}.{info['ext']}"
+                with open(img_path, 'wb') as f:
+                    f.write(info["image"])
+            else:  # CMYK: convert to RGB and re-encode
+                img_path = f"{img_prefix}page{page_num + 1}_image{img_index + 1}.png"
+                pix = fitz.Pixmap(doc, xref)
+                pix1 = fitz.Pixmap(fitz.csRGB, pix)
+                pix1.save(img_path)
+                pix1 = None
                 pix = None
 
-            except Exception as e:
-                print(f"Error extracting image {img_index} from page {page_num + 1}: {e}")
+            _SEEN_XREFS[seen_key] = img_path
+            extracted_images.append(img_path)
 
-        return extracted_images
+        except Exception as e:
+            print(f"Error extracting image {img_index} from page {page_num + 1}: {e}")
 
-    def clean_text_line(self, line: str) -> str:
-       
-        line = ' '.join(line.split())
-        line = line.replace('', '').replace('', '').strip()
-        return line
+    return extracted_images
 
-    def parse_questions_from_text(self, text: str, page_images: List[str], page_num: int) -> List[Dict]:
-       
-        questions = []
-        lines = [self.clean_text_line(line) for line in text.split('\n') if line.strip()]
 
-        current_question = None
-        current_options = []
-        current_answer = None
-        question_number = None
+@functools.lru_cache(maxsize=4096)
+def _clean_text_line(line: str) -> str:
+    # Cached: banner lines ("Vedantu", page footers, ...) recur on every
+    # page, so each unique line is only cleaned once per run
+    return ' '.join(line.translate(_STRIP_TABLE).split())
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
 
-           
-            if not line or line in ['Vedantu', 'LIVE ONLINE TUTORING', 'www.vedantu.com']:
-                i += 1
-                continue
+def _parse_questions_from_blocks(blocks: List[Tuple], page_num: int) -> List[Dict]:
 
-            
-            question_match = re.match(r'^(\d+)\.\s*(.+)', line)
-            if question_match:
-                
-                if current_question is not None:
-                    questions.append({
-                        "question_number": question_number,
-                        "question": current_question,
-                        "options": current_options,
-                        "answer": current_answer,
-                        "page": page_num + 1,
-                        "images": "",
-                        "option_images": []
-                    })
-
-                
-                question_number = int(question_match.group(1))
-                current_question = question_match.group(2).strip()
-                current_options = []
-                current_answer = None
-
-                
-                j = i + 1
-                while j < len(lines):
-                    next_line = lines[j].strip()
-
-                    # Stop if we hit options, answers, or next question
-                    if (re.match(r'^\[?[A-D]\]', next_line) or 
-                        next_line.startswith('Ans') or 
-                        re.match(r'^\d+\.', next_line) or
-                        next_line in ['??', '?'] or
-                        not next_line):
-                        break
-
-                    current_question += " " + next_line
-                    j += 1
-
-                i = j - 1
+    questions = []
+    # Flatten text blocks into cleaned lines, keeping each line's block
+    # y-coordinate so questions can be located on the page
+    lines = []
+    for x0, y0, x1, y1, block_text, block_no, block_type in blocks:
+        if block_type != 0:  # image block
+            continue
+        for raw_line in block_text.splitlines():
+            if (raw_line := raw_line.strip()):
+                lines.append((_clean_text_line(raw_line), y0))
 
-            
-            elif re.match(r'^\[?([A-D])\]?\s*(.+)?', line):
-                option_match = re.match(r'^\[?([A-D])\]?\s*(.+)?', line)
-                if option_match:
-                    option_letter = option_match.group(1)
-                    option_text = option_match.group(2) or ""
-                    current_options.append(f"[{option_letter}] {option_text}".strip())
+    current_question_parts = None
+    current_options = []
+    current_answer = None
+    question_number = None
+    question_y = None
 
-            
-            elif line.startswith('Ans'):
-                answer_match = re.search(r'Ans\.?\s*\[?([A-D])\]?', line)
-                if answer_match:
-                    current_answer = answer_match.group(1)
+    i = 0
+    while i < len(lines):
+        line = lines[i][0]  # already cleaned and stripped
 
+        if not line or line in ['Vedantu', 'LIVE ONLINE TUTORING', 'www.vedantu.com']:
             i += 1
+            continue
+
+        question_match = _RE_QUESTION.match(line)
+        if question_match:
+
+            if current_question_parts is not None:
+                questions.append({
+                    "question_number": question_number,
+                    "question": " ".join(current_question_parts),
+                    "options": current_options,
+                    "answer": current_answer,
+                    "page": page_num + 1,
+                    "block_y": question_y,
+                    "images": "",
+                    "option_images": []
+                })
+
+            question_number = int(question_match.group(1))
+            current_question_parts = [question_match.group(2).strip()]
+            current_options = []
+            current_answer = None
+            question_y = lines[i][1]
+
+            j = i + 1
+            while j < len(lines):
+                next_line = lines[j][0]
+
+                # Stop if we hit options, answers, or next question
+                if (_RE_OPTION_PREFIX.match(next_line) or
+                    next_line.startswith('Ans') or
+                    _RE_QUESTION_PREFIX.match(next_line) or
+                    next_line in ['??', '?'] or
+                    not next_line):
+                    break
+
+                current_question_parts.append(next_line)
+                j += 1
+
+            i = j - 1
+
+        elif (option_match := _RE_OPTION.match(line)):
+            option_letter = option_match.group(1)
+            option_text = option_match.group(2)
+            current_options.append(f"[{option_letter}] {option_text}".strip())
+
+        elif line.startswith('Ans'):
+            answer_match = _RE_ANSWER.search(line)
+            if answer_match:
+                current_answer = answer_match.group(1)
+
+        i += 1
+
+    # Add the last question
+    if current_question_parts is not None:
+        questions.append({
+            "question_number": question_number,
+            "question": " ".join(current_question_parts),
+            "options": current_options,
+            "answer": current_answer,
+            "page": page_num + 1,
+            "block_y": question_y,
+            "images": "",
+            "option_images": []
+        })
+
+    return questions
+
+
+def _associate_images_with_questions(questions: List[Dict], page_images: List[str],
+                                     doc: "fitz.Document", page_num: int):
+    """Assign images to questions by page geometry.
+
+    Each placed image belongs to the question whose block starts above
+    it (question text precedes its figures in reading order). The first
+    image of a question becomes its main image, the rest its option
+    images.
+    """
+    if not questions or not page_images:
+        return
+
+    # Map extracted file paths to their on-page bounding boxes
+    path_set = set(page_images)
+    placements = []
+    for info in doc[page_num].get_image_info(xrefs=True):
+        img_path = _SEEN_XREFS.get((doc.name, info["xref"]))
+        if img_path in path_set:
+            placements.append((img_path, info["bbox"]))
+
+    by_y = sorted(questions, key=lambda q: q["block_y"])
+
+    for img_path, (x0, y0, x1, y1) in placements:
+        # Last question starting above the image's top edge; images above
+        # every question (page header area) go to the first question
+        owner = by_y[0]
+        for q in by_y:
+            if q["block_y"] <= y0:
+                owner = q
+            else:
+                break
+
+        if not owner["images"]:
+            owner["images"] = img_path
+        else:
+            owner["option_images"].append(img_path)
+
+
+# Per-worker document handle, opened once by _init_worker. fitz objects
+# cannot be pickled, so each worker process keeps its own.
+_WORKER_DOC = None
+
+
+def _init_worker(pdf_path: str):
+    """Pool initializer: open the document once per worker process"""
+    global _WORKER_DOC
+    _WORKER_DOC = fitz.open(pdf_path)
+
+
+def _process_page(pdf_path: str, page_num: int, images_dir: str) -> Tuple[str, List[str], List[Dict]]:
+    """Worker function: extract all content from a single page.
+
+    Uses the per-worker document opened by _init_worker; opens (and
+    closes) a throwaway handle only when called outside a pool.
+    """
+    print(f"Processing page {page_num + 1}...")
+
+    doc = _WORKER_DOC if _WORKER_DOC is not None else fitz.open(pdf_path)
+    try:
+        blocks = doc[page_num].get_text("blocks")
+        page_text = "\n".join(b[4] for b in blocks if b[6] == 0)
+        page_images = _extract_images_from_page(doc, page_num, images_dir)
 
-        # Add the last question
-        if current_question is not None:
-            questions.append({
-                "question_number": question_number,
-                "question": current_question,
-                "options": current_options,
-                "answer": current_answer,
-                "page": page_num + 1,
-                "images": "",
-                "option_images": []
-            })
+        # Image-only pages (covers, illustrations) have nothing to parse
+        if page_text.strip():
+            page_questions = _parse_questions_from_blocks(blocks, page_num)
+            _associate_images_with_questions(page_questions, page_images, doc, page_num)
+        else:
+            page_questions = []
+    finally:
+        if doc is not _WORKER_DOC:
+            doc.close()
+
+    print(f"  Found {len(page_questions)} questions and {len(page_images)} images")
+
+    return page_text, page_images, page_questions
 
-        
-        if questions and page_images:
-            self._associate_images_with_questions(questions, page_images)
 
-        return questions
+class PDFContentExtractor:
+
+
+    def __init__(self, pdf_path: str, output_dir: str = "extracted_content"):
+        """
+        Initialize the PDF extractor
+        """
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        self.pdf_path = pdf_path
+        self.doc = fitz.open(pdf_path)
+        self.output_dir = output_dir
+        self.images_dir = os.path.join(output_dir, "images")
+
+        # Create the output directory; images_dir is created lazily when
+        # the first image (or page raster) is written
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        print(f"Initialized extractor for: {pdf_path}")
+        print(f"Total pages: {self.doc.page_count}")
+        print(f"Output directory: {self.output_dir}")
+
+    def extract_blocks(self, page_num: int) -> List[Tuple]:
+        """Extract text blocks (x0, y0, x1, y1, text, block_no, block_type)"""
+        return self.doc[page_num].get_text("blocks")
+
+    def extract_images_from_page(self, page_num: int) -> List[str]:
 
-    def _associate_images_with_questions(self, questions: List[Dict], page_images: List[str]):
-       
-        if not questions or not page_images:
-            return
+        return _extract_images_from_page(self.doc, page_num, self.images_dir)
 
-        images_per_question = max(1, len(page_images) // len(questions))
+    def clean_text_line(self, line: str) -> str:
 
-        for i, question in enumerate(questions):
-            start_idx = i * images_per_question
-            end_idx = min(start_idx + images_per_question, len(page_images))
+        return _clean_text_line(line)
 
-            if start_idx < len(page_images):
-                
-                question["images"] = page_images[start_idx]
+    def parse_questions_from_blocks(self, blocks: List[Tuple], page_num: int) -> List[Dict]:
 
-                
-                if end_idx > start_idx + 1:
-                    question["option_images"] = page_images[start_idx + 1:end_idx]
-                else:
-                    question["option_images"] = []
+        return _parse_questions_from_blocks(blocks, page_num)
 
     def extract_page_content(self, page_num: int) -> Tuple[str, List[str], List[Dict]]:
         """Extract all content from a single page"""
         print(f"Processing page {page_num + 1}...")
 
-        
-        page_text = self.extract_text_with_pdfplumber(page_num)
-        if not page_text.strip():
-            page_text = self.extract_text_from_page(page_num)
+
+        blocks = self.extract_blocks(page_num)
+        page_text = "\n".join(b[4] for b in blocks if b[6] == 0)
 
         # Extract images
         page_images = self.extract_images_from_page(page_num)
 
-        # Parse questions
-        page_questions = self.parse_questions_from_text(page_text, page_images, page_num)
+        # Parse questions (skip image-only pages entirely)
+        if page_text.strip():
+            page_questions = self.parse_questions_from_blocks(blocks, page_num)
+            _associate_images_with_questions(page_questions, page_images, self.doc, page_num)
+        else:
+            page_questions = []
 
         print(f"  Found {len(page_questions)} questions and {len(page_images)} images")
 
         return page_text, page_images, page_questions
 
-    def extract_all_content(self) -> Tuple[List[Dict], Dict]:
+    def extract_all_content(self, workers: Optional[int] = None) -> Tuple[List[Dict], Dict]:
         """
         Extract all content from the PDF
 
-        
+        Pages are independent, so they are processed in parallel across
+        `workers` processes (default: min(cpu_count, 4)).
         """
+        if workers is None:
+            workers = DEFAULT_WORKERS
+
         all_questions = []
         extraction_summary = {
             "total_pages": self.doc.page_count,
@@ -271,18 +398,39 @@ class PDFContentExtractor:
             "extraction_errors": []
         }
 
-        for page_num in range(self.doc.page_count):
-            try:
-                page_text, page_images, page_questions = self.extract_page_content(page_num)
-                all_questions.extend(page_questions)
-
-                extraction_summary["total_images"] += len(page_images)
-                extraction_summary["pages_processed"] += 1
-
-            except Exception as e:
-                error_msg = f"Error processing page {page_num + 1}: {str(e)}"
-                print(error_msg)
-                extraction_summary["extraction_errors"].append(error_msg)
+        if workers > 1 and self.doc.page_count > 1:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker,
+                                     initargs=(self.pdf_path,)) as executor:
+                futures = [
+                    executor.submit(_process_page, self.pdf_path, page_num, self.images_dir)
+                    for page_num in range(self.doc.page_count)
+                ]
+                for page_num, future in enumerate(futures):
+                    try:
+                        page_text, page_images, page_questions = future.result()
+                        all_questions.extend(page_questions)
+
+                        extraction_summary["total_images"] += len(page_images)
+                        extraction_summary["pages_processed"] += 1
+
+                    except Exception as e:
+                        error_msg = f"Error processing page {page_num + 1}: {str(e)}"
+                        print(error_msg)
+                        extraction_summary["extraction_errors"].append(error_msg)
+        else:
+            for page_num in range(self.doc.page_count):
+                try:
+                    page_text, page_images, page_questions = self.extract_page_content(page_num)
+                    all_questions.extend(page_questions)
+
+                    extraction_summary["total_images"] += len(page_images)
+                    extraction_summary["pages_processed"] += 1
+
+                except Exception as e:
+                    error_msg = f"Error processing page {page_num + 1}: {str(e)}"
+                    print(error_msg)
+                    extraction_summary["extraction_errors"].append(error_msg)
 
         extraction_summary["total_questions"] = len(all_questions)
 
@@ -293,48 +441,35 @@ class PDFContentExtractor:
         Save extracted content to JSON file
 
         """
-        # Convert to the required format
-        formatted_questions = []
-        for q in questions:
-            formatted_q = {
-                "question": q["question"],
-                "images": q["images"],
-                "option_images": q["option_images"]
-            }
-            
-            if q.get("options"):
-                formatted_q["options"] = q["options"]
-            if q.get("answer"):
-                formatted_q["answer"] = q["answer"]
-            if q.get("question_number"):
-                formatted_q["question_number"] = q["question_number"]
-            if q.get("page"):
-                formatted_q["page"] = q["page"]
-
-            formatted_questions.append(formatted_q)
-
-        
-        detailed_output = {
-            "metadata": {
-                "source_file": self.pdf_path,
-                "extraction_date": datetime.now().isoformat(),
-                "extractor_version": "2.0",
-                "total_questions": len(questions),
-                "total_images": summary.get("total_images", 0)
-            },
-            "summary": summary,
-            "questions": formatted_questions
+        metadata = {
+            "source_file": self.pdf_path,
+            "extraction_date": datetime.now().isoformat(),
+            "extractor_version": "2.0",
+            "total_questions": len(questions),
+            "total_images": summary.get("total_images", 0)
         }
 
-        
         output_path = os.path.join(self.output_dir, output_file)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(formatted_questions, f, indent=2, ensure_ascii=False)
-
-        # Save detailed format
         detailed_path = os.path.join(self.output_dir, "detailed_" + output_file)
-        with open(detailed_path, 'w', encoding='utf-8') as f:
-            json.dump(detailed_output, f, indent=2, ensure_ascii=False)
+
+        # Stream both files in a single pass over the questions instead of
+        # materializing a formatted copy of every question first
+        with open(output_path, 'wb') as simple_f, open(detailed_path, 'wb') as detailed_f:
+            detailed_f.write(b'{"metadata":' + _dumps(metadata) +
+                             b',"summary":' + _dumps(summary) +
+                             b',"questions":[')
+            simple_f.write(b'[')
+
+            for i, q in enumerate(questions):
+                chunk = _dumps(_format_question(q))
+                if i:
+                    simple_f.write(b',')
+                    detailed_f.write(b',')
+                simple_f.write(chunk)
+                detailed_f.write(chunk)
+
+            simple_f.write(b']')
+            detailed_f.write(b']}')
 
         print(f"Simple format saved to: {output_path}")
         print(f"Detailed format saved to: {detailed_path}")
@@ -343,74 +478,90 @@ class PDFContentExtractor:
 
     def generate_report(self, questions: List[Dict], summary: Dict) -> str:
         """Generate extraction statistics report"""
-        report = []
-        report.append("=" * 60)
-        report.append("PDF CONTENT EXTRACTION REPORT")
-        report.append("=" * 60)
-        report.append(f"Source File: {self.pdf_path}")
-        report.append(f"Extraction Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 60 + "\n")
+        w("PDF CONTENT EXTRACTION REPORT\n")
+        w("=" * 60 + "\n")
+        w(f"Source File: {self.pdf_path}\n")
+        w(f"Extraction Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w("\n")
 
         # Basic statistics
-        report.append("EXTRACTION SUMMARY:")
-        report.append(f"  Total Pages: {summary['total_pages']}")
-        report.append(f"  Pages Processed: {summary['pages_processed']}")
-        report.append(f"  Total Questions: {summary['total_questions']}")
-        report.append(f"  Total Images: {summary['total_images']}")
+        w("EXTRACTION SUMMARY:\n")
+        w(f"  Total Pages: {summary['total_pages']}\n")
+        w(f"  Pages Processed: {summary['pages_processed']}\n")
+        w(f"  Total Questions: {summary['total_questions']}\n")
+        w(f"  Total Images: {summary['total_images']}\n")
 
         if summary.get('extraction_errors'):
-            report.append(f"  Extraction Errors: {len(summary['extraction_errors'])}")
+            w(f"  Extraction Errors: {len(summary['extraction_errors'])}\n")
 
-        report.append("")
+        w("\n")
 
         
         if questions:
-            report.append("QUESTION ANALYSIS:")
+            w("QUESTION ANALYSIS:\n")
 
             
-            pages_with_questions = {}
-            for q in questions:
-                page = q.get('page', 'Unknown')
-                pages_with_questions[page] = pages_with_questions.get(page, 0) + 1
+            pages_with_questions = Counter(q.get('page', 'Unknown') for q in questions)
+            known_pages = sorted(p for p in pages_with_questions if p != 'Unknown')
 
-            report.append(f"  Pages with Questions: {len(pages_with_questions)}")
-            for page in sorted(pages_with_questions.keys()):
-                if page != 'Unknown':
-                    report.append(f"    Page {page}: {pages_with_questions[page]} questions")
+            w(f"  Pages with Questions: {len(pages_with_questions)}\n")
+            for page in known_pages:
+                w(f"    Page {page}: {pages_with_questions[page]} questions\n")
 
            
             questions_with_images = sum(1 for q in questions if q.get('images') or q.get('option_images'))
-            report.append(f"  Questions with Images: {questions_with_images}")
+            w(f"  Questions with Images: {questions_with_images}\n")
 
             
-            answer_counts = {}
-            for q in questions:
-                answer = q.get('answer')
-                if answer:
-                    answer_counts[answer] = answer_counts.get(answer, 0) + 1
+            answer_counts = Counter(q['answer'] for q in questions if q.get('answer'))
 
             if answer_counts:
-                report.append("  Answer Distribution:")
-                for answer in sorted(answer_counts.keys()):
-                    report.append(f"    {answer}: {answer_counts[answer]} questions")
+                w("  Answer Distribution:\n")
+                for answer in sorted(answer_counts):
+                    w(f"    {answer}: {answer_counts[answer]} questions\n")
 
         # File outputs
-        report.append("")
-        report.append("OUTPUT FILES:")
-        report.append(f"  Images Directory: {self.images_dir}")
-        report.append(f"  JSON Output: {os.path.join(self.output_dir, 'extracted_content.json')}")
-        report.append(f"  Detailed JSON: {os.path.join(self.output_dir, 'detailed_extracted_content.json')}")
+        w("\n")
+        w("OUTPUT FILES:\n")
+        w(f"  Images Directory: {self.images_dir}\n")
+        w(f"  JSON Output: {os.path.join(self.output_dir, 'extracted_content.json')}\n")
+        w(f"  Detailed JSON: {os.path.join(self.output_dir, 'detailed_extracted_content.json')}\n")
 
         if summary.get('extraction_errors'):
-            report.append("")
-            report.append("EXTRACTION ERRORS:")
+            w("\n")
+            w("EXTRACTION ERRORS:\n")
             for error in summary['extraction_errors']:
-                report.append(f"  - {error}")
+                w(f"  - {error}\n")
 
-        report.append("")
-        report.append("=" * 60)
+        w("\n")
+        w("=" * 60)
 
-        return "\n".join(report)
+        return buf.getvalue()
+
+    def extract_page_raster(self, page_num: int, dpi: int = 150) -> bytes:
+        """Render a full page to PNG bytes (for downstream vision models)"""
+        pix = self.doc[page_num].get_pixmap(dpi=dpi)
+        return pix.tobytes("png")
+
+    def export_page_rasters(self, dpi: int = 150) -> List[str]:
+        """Render every page to a PNG in the images directory.
+
+        Pages are rendered and written one at a time so only a single
+        pixmap is alive at any moment, keeping memory bounded on long
+        PDFs.
+        """
+        os.makedirs(self.images_dir, exist_ok=True)
+
+        raster_paths = []
+        for page_num in range(self.doc.page_count):
+            raster_path = os.path.join(self.images_dir, f"page{page_num + 1}_full.png")
+            with open(raster_path, 'wb') as f:
+                f.write(self.extract_page_raster(page_num, dpi=dpi))
+            raster_paths.append(raster_path)
+        return raster_paths
 
     def close(self):
         """Close the PDF document"""
@@ -429,8 +580,14 @@ Examples:
         """
     )
     parser.add_argument("pdf_file", help="Path to the PDF file to process")
-    parser.add_argument("--output-dir", default="extracted_content", 
+    parser.add_argument("--output-dir", default="extracted_content",
                        help="Output directory (default: extracted_content)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                       help=f"Number of parallel page workers (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--render-pages", action="store_true",
+                       help="Also render each full page to a PNG (for vision models)")
+    parser.add_argument("--render-dpi", type=int, default=150,
+                       help="Resolution for --render-pages (default: 150)")
 
     args = parser.parse_args()
 
@@ -441,7 +598,7 @@ Examples:
         print("\nStarting content extraction...")
 
         
-        questions, summary = extractor.extract_all_content()
+        questions, summary = extractor.extract_all_content(workers=args.workers)
 
         print("\nExtraction completed!")
         print(f"Found {summary['total_questions']} questions and {summary['total_images']} images")
@@ -449,6 +606,10 @@ Examples:
         # Save to JSON
         json_path = extractor.save_to_json(questions, summary)
 
+        if args.render_pages:
+            raster_paths = extractor.export_page_rasters(dpi=args.render_dpi)
+            print(f"Rendered {len(raster_paths)} page images at {args.render_dpi} dpi")
+
         
         report = extractor.generate_report(questions, summary)
         print("\n" + report)
@@ -6,8 +6,8 @@ echo.
 
 echo Installing required Python packages...
 pip install PyMuPDF==1.23.14
-pip install pdfplumber==0.10.3  
 pip install Pillow==10.1.0
+pip install orjson==3.8.3
 
 echo.
 echo ===========================================